@@ -2,6 +2,9 @@ from ...helpers.arguments import Parser
 from ...helpers.commands import *
 import os
 
+# Windows paths are shown with forward slashes, on other systems there is nothing to replace
+_NEEDS_SLASH_FIX = os.sep == "\\"
+
 
 class Command(CommandInterface):
     def init(self):
@@ -21,11 +24,10 @@ class Command(CommandInterface):
     def run(self):
         if self.args.dir:
             try:
-                new_dir: str = "" + self.args.dir.strip('"').strip("'")
+                new_dir: str = self.args.dir.strip("\"'")
                 if new_dir.startswith("$"):
                     new_dir = self.sysinfo.variables.get(new_dir).value or new_dir
                 os.chdir(f"{new_dir}")
-                self.sysinfo.variables.set("$PWD", new_dir)
 
             except FileNotFoundError:
                 self.error(self.errors.path_not_found(new_dir))
@@ -36,10 +38,12 @@ class Command(CommandInterface):
             except OSError:
                 self.error(self.errors.cannot_read_fod(new_dir))
 
-            self.sysinfo.user.paths.terminal = os.getcwd()
-            self.sysinfo.user.paths.terminal.replace("\\", "/")
+            cwd = os.getcwd()
+            self.sysinfo.user.paths.terminal = cwd.replace("\\", "/") if _NEEDS_SLASH_FIX else cwd
+            self.sysinfo.variables.set("$PWD", self.sysinfo.user.paths.terminal)
 
         else:
-            os.chdir(self.sysinfo.variables.get("$HOME").value)
-            self.sysinfo.user.paths.terminal = self.sysinfo.variables.get("$HOME").value
-            self.sysinfo.variables.set("$PWD", self.sysinfo.user.paths.terminal)
+            home = self.sysinfo.variables.get("$HOME").value
+            os.chdir(home)
+            self.sysinfo.user.paths.terminal = home
+            self.sysinfo.variables.set("$PWD", home)
@@ -1,15 +1,24 @@
 from ...helpers.arguments import Parser
 from ...helpers.commands import *
 import os
+import sys
+
+# Erase the screen and move the cursor to the top left corner
+CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
 
 class Command(CommandInterface):
     def init(self):
         self.parser = Parser(prog="clear", description="clears the screen")
     
     def run(self):
+        # Terminals understand the escape sequence directly (colorama translates it on windows),
+        # there is no need to start a shell for it
+        if self.stdout is sys.stdout and sys.stdout.isatty():
+            self.print(CLEAR_SEQUENCE, end="", flush=True)
+            return
+
         if os.name == 'nt':
             self.status = os.system("cls")
         else:
             self.status = os.system("clear")
         
-
@@ -12,23 +12,19 @@ class Command(CommandInterface):
         self.parser.add_argument("command", action="append", help="the command to run")
 
     def setup(self):
-        if "-h" in self.command and self.command.index("-h") == 1:
-            super().setup()
-        
-        elif "--help" in self.command and self.command.index("--help") == 1:
+        args = self.command[1:]
+
+        if args and args[0] in ("-h", "--help"):
             super().setup()
-        
-        elif len(self.command) < 2:
+            return
+
+        if not args:
             # print an help message
             self.command.append("-h")
             super().setup()
-
-        elif len(self.command[1:]) == 0 :
-            self.error(self.errors.parameter_not_specified("command"))
-            self.parser.exit_execution = True
             return
 
-        self.command = self.command[1:]
+        self.command = args
 
     def run(self):
         global p
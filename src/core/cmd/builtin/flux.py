@@ -1,9 +1,20 @@
-import colorama
 from colorama import Fore
 import random
 from ...helpers.commands import CommandInterface
 from ...helpers.arguments import Parser
-colorama.init(autoreset=True)
+
+# colorama is initialized once by main.py, here we just need the colors
+EMOTES = ["(╯°□°)╯︵ ┻━┻", "(ノಠ益ಠ)ノ彡┻━┻", "┬─┬ノ( º _ ºノ)", "¯\_(ツ)_/¯"]
+TITLE = Fore.LIGHTBLACK_EX + """
+    {:^27}
+     _____ __    __ __  __  __ 
+    |   __|  |  |  |  |\  \/  /
+    |   _]|  |__|  |  | |    | 
+    |__|  |_____\_____//__/\__\ 
+            
+    {:^27}
+    
+    """
 
 
 class Command(CommandInterface):
@@ -19,16 +30,5 @@ class Command(CommandInterface):
 
 
     def description(self, flip: bool = False):
-        emotes = ["(╯°□°)╯︵ ┻━┻", "(ノಠ益ಠ)ノ彡┻━┻", "┬─┬ノ( º _ ºノ)", "¯\_(ツ)_/¯"]
-        emote = random.choice(emotes) if flip else ""
-        title = Fore.LIGHTBLACK_EX + """
-    {:^27}
-     _____ __    __ __  __  __ 
-    |   __|  |  |  |  |\  \/  /
-    |   _]|  |__|  |  | |    | 
-    |__|  |_____\_____//__/\__\ 
-            
-    {:^27}
-    
-    """.format(emote, "By @RoysManfo")
-        self.print(title + Fore.RESET)
+        emote = random.choice(EMOTES) if flip else ""
+        self.print(TITLE.format(emote, "By @RoysManfo") + Fore.RESET)
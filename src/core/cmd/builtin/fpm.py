@@ -1,5 +1,6 @@
 from ...helpers.commands import *
 from ...helpers.arguments import Parser
+from src.utils.format import create_adaptive_table
 
 
 COMMANDS_AVAILABLE = [
@@ -29,5 +30,4 @@ class Command(CommandInterface):
     def run(self):
         
         if self.args.list:
-            from src.utils.format import create_adaptive_table
             self.print(create_adaptive_table("Name", "Description", contents=COMMAND_DESC))
@@ -29,20 +29,68 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import errno
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 import shutil
 from pathlib import Path
 import sys
+import tempfile
+import threading
 import time
+from typing import Optional
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, DirModifiedEvent
+from watchdog.events import FileSystemEventHandler
 from ...helpers.arguments import Parser
 from ...helpers.commands import CommandInterface
 from src import utils
 
 
 extension_paths = {}
+
+# Normalized copy of extension_paths used to sort files, see `_index_extensions`
+_subdirs_by_len: list[tuple[int, dict[str, str]]] = []
+_default_subdir: str = ""
+
+
+def _index_extensions() -> None:
+    """
+    Rebuilds the lookup tables used to sort files from `extension_paths`,
+    extensions are stripped, lowercased and grouped by length once here instead of on every lookup
+    """
+    global _subdirs_by_len, _default_subdir
+    by_len: dict[int, dict[str, str]] = {}
+
+    for ext, dest in extension_paths.items():
+        ext = ext.strip().lower()
+        if ext.startswith("."):
+            by_len.setdefault(len(ext), {})[ext] = dest
+
+    # Longest first, so '.tar.gz' wins over '.gz'
+    _subdirs_by_len = sorted(by_len.items(), reverse=True)
+    _default_subdir = extension_paths.get("noname") or EXTENSIONS["noname"]
+
+
+def _get_subdir(name: str) -> str:
+    """
+    Returns the destination subfolder for a file name, matching the end of the name
+    against the known extensions instead of splitting it
+    :param str name: name of the file
+    """
+    name = name.lower()
+    size = len(name)
+
+    for length, subdirs in _subdirs_by_len:
+        # Like splitext, a name made only of the extension (es. '.gitignore') has no extension
+        if size > length:
+            subdir = subdirs.get(name[-length:])
+            if subdir:
+                return subdir
+
+    return _default_subdir
+
+
 class Command(CommandInterface):
 
     def init(self) -> None:
@@ -88,7 +136,9 @@ options:
             self.error(self.errors.permission_denied(jpath))
             self.parser.exit_execution = True
         
-        finally: 
+        finally:
+            _index_extensions()
+
             if sys.version_info >= (3, 12):
                 detected = "%s.%s.%s" % (sys.version_info.major, sys.version_info.minor, sys.version_info.micro)
                 self.error("the way this program handles threads is not yet suported after python 3.11 (detected %s)" % detected)
@@ -138,6 +188,7 @@ options:
             return
 
         extension_paths.pop(ext)
+        _index_extensions()
 
         try:
             with open(self.ext_path, "w") as f:            
@@ -162,6 +213,7 @@ options:
             return
 
         extension_paths.update({new_ext: dest})
+        _index_extensions()
 
         try:
             with open(self.ext_path, "w") as f:            
@@ -186,6 +238,7 @@ options:
             return
 
         extension_paths.update({ext: dest})
+        _index_extensions()
         
         try:
             with open(self.ext_path, "w") as f:            
@@ -222,38 +275,42 @@ options:
             event_handler = self.EventHandler(watch_path, destination_root)
 
             observer = Observer()
-            observer.schedule(event_handler, f'{watch_path}', recursive=True)
+            # Only the bucket itself is sorted, watching its subfolders (the destination
+            # is one by default) would add a watch and events for each of them
+            observer.schedule(event_handler, event_handler.watch_path, recursive=False)
 
             try:
-                if not observer.is_alive():
-                    observer.start()
-                else:
-                    self.warning("observer is already running")
-            except RuntimeError as e:
-                self.error("could not start observer {}".format(e.__str__()))
-                return
+                try:
+                    if not observer.is_alive():
+                        observer.start()
+                    else:
+                        self.warning("observer is already running")
+                except RuntimeError as e:
+                    self.error(f"could not start observer {e}")
+                    return
 
-            event_handler.on_modified(DirModifiedEvent)
+                event_handler.scan()
 
-            # Check if we decided to run the process as a background task
-            if self.IS_PROCESS:
+                # Check if we decided to run the process as a background task
+                if self.IS_PROCESS:
 
-                try:
-                    while not self.sysinfo.exit:
-                        time.sleep(.1)
+                    try:
+                        # Sleep on the observer thread instead of polling, waking up
+                        # once a second to check if the shell is closing
+                        while not self.sysinfo.exit and observer.is_alive():
+                            observer.join(timeout=1)
 
-                    observer.stop()
-                except Exception as e:
-                    observer.stop()
-                    self.warning(e)
-                    return
-            else:
-                time.sleep(1)
-                observer.stop()
+                    except Exception as e:
+                        self.warning(e)
+                        return
+                else:
+                    time.sleep(1)
 
-            # End the process
-            observer.join()
-            return
+            finally:
+                # End the process, also when returning early or before retrying below
+                if observer.is_alive():
+                    observer.stop()
+                    observer.join()
 
         except FileNotFoundError:
             # We deleted one or both directories
@@ -266,40 +323,120 @@ options:
         """
 
         def __init__(self, watch_path: Path, destination_root: Path) -> None:
-            self.watch_path = watch_path.resolve()
-            self.destination_root = destination_root.resolve()
+            # Resolved once and kept as strings, files are handled with os.path
+            # to not build Path objects for every file
+            self.watch_path: str = str(watch_path.resolve())
+            self.destination_root: str = str(destination_root.resolve())
+
+            # Destination folders already created by this handler, by subfolder
+            self._ensured_dirs: dict[str, str] = {}
+
+            # Last number appended to a file name, by (destination, stem, suffix)
+            self._name_counters: dict[tuple[str, str, str], int] = {}
+
+            # Both folders must exist to be inspected below
+            self.restore_dirs()
+
+            # Moves within one filesystem are a rename, no need to go through shutil
+            try:
+                self._same_device = os.stat(self.watch_path).st_dev == os.stat(self.destination_root).st_dev
+            except OSError:
+                self._same_device = False
+
+            # Names only clash regardless of case where the filesystem ignores it
+            self._case_insensitive = self._is_case_insensitive(self.destination_root)
+
+            # Events arrive on the observer thread while scans run on the command's thread,
+            # names are picked and files moved by one of them at a time
+            self._moving = threading.Lock()
 
         @staticmethod
-        def create_destination_path(path: Path) -> Path:
+        def _is_case_insensitive(path: str) -> bool:
+            """
+            Checks if the filesystem of a directory ignores the case of file names,
+            assumes it does if it can't be checked so that no file gets overwritten
+            :param str path: an existing directory
+            """
+            try:
+                fd, probe = tempfile.mkstemp(prefix="flux_case_", dir=path)
+            except OSError:
+                return True
+
+            try:
+                os.close(fd)
+                return os.path.exists(os.path.join(path, os.path.basename(probe).upper()))
+            finally:
+                os.remove(probe)
+
+        def fold_name(self, name: str) -> str:
+            """
+            Returns the form of a file name used to compare it with other names
+            :param str name: name of the file
             """
-            Helper function that adds current year/month to destination path. If the path
-            doesn't already exist, it is created.
-            :param Path path: destination root to append subdirectories based on date
+            return name.casefold() if self._case_insensitive else name
+
+        def create_destination_path(self, subdir: str) -> str:
             """
-            path.mkdir(parents=True, exist_ok=True)
+            Helper function that creates the destination path if it doesn't already exist,
+            each path is created only once per handler
+            :param str subdir: destination directory, relative to the destination root
+            """
+            path = self._ensured_dirs.get(subdir)
+            if path is None:
+                path = os.path.normpath(os.path.join(self.destination_root, subdir))
+                os.makedirs(path, exist_ok=True)
+                self._ensured_dirs[subdir] = path
             return path
 
-        @staticmethod
-        def rename_file(source: Path, destination_path: Path) -> Path:
+        def move_file(self, source: str, destination: str) -> None:
+            """
+            Helper function that moves a file, renaming it in place when the bucket
+            and the destination are on the same filesystem
+            :param str source: file to be moved
+            :param str destination: full path of the moved file
+            """
+            if self._same_device:
+                try:
+                    os.replace(source, destination)
+                    return
+                except OSError as e:
+                    # A destination folder may still be mounted from another device
+                    if e.errno != errno.EXDEV:
+                        raise
+
+            shutil.move(src=source, dst=destination)
+
+        def rename_file(self, name: str, destination_path: str, existing: Optional[set[str]] = None) -> str:
             """
             Helper function that renames file to reflect new path. If a file of the same
             name already exists in the destination folder, the file name is numbered and
             incremented until the filename is unique (prevents overwriting files).
-            :param Path source: source of file to be moved
-            :param Path destination_path: path to destination directory
+            :param str name: name of the file to be moved
+            :param str destination_path: path to destination directory
+            :param set existing: names already in the destination directory as returned by `fold_name`,
+                the chosen name gets added to it. If not given every candidate name is checked on disk
             """
-            if Path(destination_path / source.name).exists():
-                increment = 0
 
-                while True:
+            def is_taken(name: str) -> bool:
+                if existing is None:
+                    return os.path.exists(os.path.join(destination_path, name))
+                return self.fold_name(name) in existing
+
+            if is_taken(name):
+                # Continue numbering from the last number used for this name
+                stem, suffix = os.path.splitext(name)
+                key = (destination_path, self.fold_name(stem), self.fold_name(suffix))
+                increment = self._name_counters.get(key, 0)
+
+                while is_taken(name):
                     increment += 1
-                    new_name = destination_path / \
-                        f'{source.stem}_{increment}{source.suffix}'
+                    name = f'{stem}_{increment}{suffix}'
+
+                self._name_counters[key] = increment
 
-                    if not new_name.exists():
-                        return new_name
-            else:
-                return destination_path / source.name
+            if existing is not None:
+                existing.add(self.fold_name(name))
+            return os.path.join(destination_path, name)
 
         def restore_dirs(self) -> None:
             """    
@@ -312,32 +449,86 @@ options:
 
             try:
                 os.makedirs(self.destination_root)
+
+                # The destination folders got deleted too
+                self._ensured_dirs.clear()
             except:
                 pass
 
-        def on_modified(self, event) -> None:
+        def on_created(self, event) -> None:
+            if not event.is_directory:
+                self.sort_file(event.src_path)
+
+        def on_moved(self, event) -> None:
+            if not event.is_directory:
+                self.sort_file(event.dest_path)
+
+        def sort_file(self, path: str) -> None:
+            """
+            Moves a single file from the bucket to its destination folder
+            :param str path: path of the file reported by the event
+            """
+
+            # Only direct children of the bucket get sorted
+            if os.path.dirname(path) != self.watch_path:
+                return
+
+            with self._moving:
+                for _ in range(2):
+                    if not os.path.isfile(path):
+                        return
+
+                    try:
+                        name = os.path.basename(path)
+                        destination_path = self.create_destination_path(_get_subdir(name))
+                        destination_path = self.rename_file(name, destination_path)
+                        self.move_file(path, destination_path)
+                        return
+
+                    except FileNotFoundError:
+                        # The bucket or the destination folders got deleted, restore them and retry
+                        self._ensured_dirs.clear()
+                        self.restore_dirs()
+
+        def scan(self) -> None:
+            """
+            Sorts every file already in the bucket
+            """
+            with self._moving:
+                self._scan()
+
+        def _scan(self) -> None:
             self.restore_dirs()
 
-            for child in self.watch_path.iterdir():
-
-                # skips directories and non-specified extensions
-                if child.is_file() and child.suffix.lower() in extension_paths:
-                    destination_path = self.destination_root / \
-                        extension_paths[child.suffix.lower()]
-                    destination_path = self.create_destination_path(
-                        destination_path)
-                    destination_path = self.rename_file(
-                        child, destination_path)
-                    shutil.move(src=child, dst=destination_path)
-
-                elif child.is_file() and child.suffix.lower() not in extension_paths:
-                    destination_path = self.destination_root / \
-                        extension_paths["noname"]
-                    destination_path = self.create_destination_path(
-                        destination_path)
-                    destination_path = self.rename_file(
-                        child, destination_path)
-                    shutil.move(src=child, dst=destination_path)
+            # Every destination directory is listed only once per scan
+            existing_names: dict[str, set[str]] = {}
+
+            # Names are chosen here, only the moves run in the pool
+            moves: list[Future] = []
+
+            # Moving files is I/O bound, so moves can overlap. Leaving the block waits for all of them
+            with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 2) * 2), thread_name_prefix="observer") as pool:
+
+                # DirEntry caches the file type, so no extra stat() per file is needed
+                with os.scandir(self.watch_path) as entries:
+                    for entry in entries:
+
+                        # skips directories
+                        if not entry.is_file():
+                            continue
+
+                        # non-specified extensions go in the `noname` folder
+                        destination_path = self.create_destination_path(_get_subdir(entry.name))
+
+                        if destination_path not in existing_names:
+                            existing_names[destination_path] = {self.fold_name(name) for name in os.listdir(destination_path)}
+
+                        destination_path = self.rename_file(entry.name, destination_path, existing_names[destination_path])
+                        moves.append(pool.submit(self.move_file, entry.path, destination_path))
+
+            # Raise the first error encountered
+            for move in moves:
+                move.result()
 
 # TODO: Not store extensions here but add an alternative method to restore externsions.json 
 EXTENSIONS = {
@@ -35,11 +35,15 @@ class Command(CommandInterface):
             return
         
         if self.args.dir:
-            folders = os.listdir(self.args.path or self.sysinfo.user.paths.terminal)
-            folders = [os.path.abspath(i) for i in folders if os.path.isdir(i)]
+            # DirEntry already knows if it's a directory, no need to stat every entry
+            with os.scandir(self.args.path or self.sysinfo.user.paths.terminal) as entries:
+                folders = [os.path.abspath(entry.path) for entry in entries if entry.is_dir()]
             
             for folder in folders:
-                if len(os.listdir(folder)) == 0:
+                with os.scandir(folder) as entries:
+                    is_empty = next(entries, None) is None
+
+                if is_empty:
                     try:
                         os.rmdir(folder)
                         if self.args.verbose:
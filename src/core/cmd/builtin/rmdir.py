@@ -17,7 +17,10 @@ class Command(CommandInterface):
             if not os.path.exists(folder):
                 self.error(self.errors.path_not_found(folder))
 
-            elif len(os.listdir(folder)) > 0 :
+            elif not os.path.isdir(folder):
+                self.error(self.errors.not_a_dir(folder))
+
+            elif not self._is_empty(folder):
                 self.error(f"rmdir: failed to remove `{folder}`: Directory not empty")
             
             else:
@@ -36,6 +39,14 @@ class Command(CommandInterface):
                 except OSError:
                     self.error(self.errors.path_not_found(folder))
 
+    @staticmethod
+    def _is_empty(folder: str) -> bool:
+        """
+        Checks if a directory is empty without reading all of its entries
+        """
+        with os.scandir(folder) as entries:
+            return next(entries, None) is None
+
 
 
         
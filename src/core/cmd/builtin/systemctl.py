@@ -4,6 +4,7 @@ Allows the user to change different settings, such as the username or info.user.
 """
 from pathlib import Path
 from ...helpers.arguments import Parser
+from src.utils.format import create_adaptive_table
 from ...helpers.commands import *
 
 class Command(CommandInterface):
@@ -84,7 +85,6 @@ class Command(CommandInterface):
                     except KeyError:
                         self.error(f"setting not found")
             else:
-                from src.utils.format import create_adaptive_table
                 c = [(p, self.sysinfo.user.paths.all_paths[p]) for p in self.sysinfo.user.paths.all_paths.keys()]
                 
                 self.print(create_adaptive_table("Path name", "Value", contents=c))
@@ -7,7 +7,9 @@ from argparse import Namespace as _Namespace
 
 from src.settings.info import Info
 from src.core.system.processes import (STATUS_OK, STATUS_ERR, STATUS_WARN)
+from src.utils.crash_handler import write_error_log as _write_error_log
 from .arguments import Parser
+from . import colors as _colors
 
 class CommandInterface(_ABC):
     """
@@ -111,6 +113,10 @@ class CommandInterface(_ABC):
         self.levels = _Levels
         self.log_level = self.levels.NOTSET
 
+    # main.py imports this module as `core.helpers.commands` while builtins import it as
+    # `src.core.helpers.commands`, so there are two CommandInterface classes at runtime
+    # and issubclass/isinstance can't be used to recognise commands
+
     def __init_subclass__(cls) -> None:
         cls._FLUX_COMMAND = True
 
@@ -168,18 +174,13 @@ class CommandInterface(_ABC):
         """
         This is the function that gets called after we run the command.\n
         This function is used to close open files, like a redirected stdout
-        """        
-
-        if self.stdout != _sys.stdout:
-            self.stdout.close()
-        
-        if self.stderr != _sys.stderr:
-            self.stderr.close()
-
-        if self.stdin != _sys.stdin:
-            self.stdin.close()
-
+        """
+        self._close_streams()
 
+    def _close_streams(self) -> None:
+        for stream, default in ((self.stdout, _sys.stdout), (self.stderr, _sys.stderr), (self.stdin, _sys.stdin)):
+            if stream != default:
+                stream.close()
 
     def exit(self):
         """
@@ -197,30 +198,20 @@ class CommandInterface(_ABC):
         By default creates a crash report as a temp file for the user to see with all the Traceback informations
         and sets `self.status` to `STATUS_ERR`
         """
-        from src.utils.crash_handler import write_error_log
         prefx = self.parser.prog if self.parser else self.command[0]
         prefx += '_'
         
         if prefx == '_':
             prefx = None
         
-        tmp = write_error_log(prefx)[1]
+        tmp = _write_error_log(prefx)[1]
 
         self.printerr(f"An error accoured while trying to execute command  ({type(exception).__name__})")
         self.printerr(f"The full error log can be found here: \n{tmp}\n")
         self.status = STATUS_ERR
 
         # close possibly open files
-        if self.stdout != _sys.stdout:
-            self.stdout.close()
-        
-        if self.stderr != _sys.stderr:
-            self.stderr.close()
-
-        if self.stdin != _sys.stdin:
-            self.stdin.close()
-
-        
+        self._close_streams()
 
     """
     LOGGING FUNCTIONS
@@ -343,8 +334,9 @@ class CommandInterface(_ABC):
         \twhether to forcibly flush the stream.
         """
         if self.stdout:
-            self.stdout.write(f"{sep}".join([ v.__str__() for v in values]))
-            self.stdout.write(end)
+            write = self.stdout.write
+            write(sep.join(map(str, values)))
+            write(end)
 
             if flush:
                 self.stdout.flush()
@@ -363,11 +355,12 @@ class CommandInterface(_ABC):
         \twhether to forcibly flush the stream.
         """
         if self.stderr:
-            self.stderr.write(f"{sep}".join([ v.__str__() for v in values]))
-            self.stderr.write(end)
+            write = self.stderr.write
+            write(sep.join(map(str, values)))
+            write(end)
 
             if flush:
-                self.stdout.flush()
+                self.stderr.flush()
 
 
 
@@ -503,8 +496,7 @@ class _Levels(_IntEnum):
 
 class Colors:
     def __init__(self, to_file: bool) -> None:
-        from . import colors
-        self.Fore = colors.Foreground(to_file)
-        self.Back = colors.Background(to_file)
-        self.Style = colors.Styles(to_file)
+        self.Fore = _colors.Foreground(to_file)
+        self.Back = _colors.Background(to_file)
+        self.Style = _colors.Styles(to_file)
 
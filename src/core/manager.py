@@ -21,11 +21,9 @@ def get_stdout(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
     :returns
         - The stdout on which write the output
         - the path to that file 
-
-    :rtype Actually returns a list [TextIO | None, str | None]
     """
     
-    STD_OUT: list[TextIO, Optional[str]]
+    STD_OUT: Tuple[Optional[TextIO], Optional[str]]
     REDIRECT: str
     MODE: str
     pathname = None
@@ -41,7 +39,7 @@ def get_stdout(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
         MODE = "wt"
 
     else:
-        return [sys.stdout, None]
+        return (sys.stdout, None)
 
 
     if command.index(REDIRECT) < len(command) - 1:
@@ -49,13 +47,13 @@ def get_stdout(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
             pathname = command[command.index(REDIRECT) + 1]
             command.remove(REDIRECT)
             command.remove(pathname)
-            STD_OUT = [open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None]
+            STD_OUT = (open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None)
         
         except (PermissionError, OSError):
-            STD_OUT = [None, pathname]
+            STD_OUT = (None, pathname)
         
     else:
-        STD_OUT = [None, pathname]
+        STD_OUT = (None, pathname)
 
     return STD_OUT
 
@@ -67,11 +65,9 @@ def get_stderr(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
     :returns
         - The stderr on which write the output (None if redirected to /dev/null)
         - the path to that file 
-
-    :rtype Actually returns a list [TextIO | None, str | None]
     """
     
-    STD_ERR: list[TextIO, Optional[str]]
+    STD_ERR: Tuple[Optional[TextIO], Optional[str]]
     REDIRECT: str
     MODE: str
     pathname = None
@@ -86,7 +82,7 @@ def get_stderr(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
         MODE = "wt"
 
     else:
-        return [sys.stderr, None]
+        return (sys.stderr, None)
 
 
     if command.index(REDIRECT) < len(command) - 1:
@@ -95,13 +91,13 @@ def get_stderr(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
             command.remove(REDIRECT)
             command.remove(pathname)
             
-            STD_ERR = [open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None]
+            STD_ERR = (open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None)
         
         except (PermissionError, OSError):
-            STD_ERR = [None, pathname]
+            STD_ERR = (None, pathname)
         
     else:
-        STD_ERR = [None, pathname]
+        STD_ERR = (None, pathname)
 
     return STD_ERR
 
@@ -113,11 +109,9 @@ def get_stdin(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
     :returns
         - The stdin on which read the input (None if redirected to /dev/null)
         - the path to that file 
-
-    :rtype Actually returns a list [TextIO | None, str | None]
     """
     
-    STD_IN: list[TextIO, Optional[str]]
+    STD_IN: Tuple[Optional[TextIO], Optional[str]]
     REDIRECT: str
     MODE: str
     pathname = None
@@ -126,7 +120,7 @@ def get_stdin(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
         REDIRECT = "<"
         MODE = "rt"
     else:
-        return [sys.stdin, None]
+        return (sys.stdin, None)
 
 
     if command.index(REDIRECT) < len(command) - 1:
@@ -135,13 +129,13 @@ def get_stdin(command: List[str]) -> Tuple[Optional[TextIO], Optional[str]]:
             command.remove(REDIRECT)
             command.remove(pathname)
             
-            STD_IN = [open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None]
+            STD_IN = (open(pathname, MODE) if pathname != NULL_PATH else None, pathname if pathname != NULL_PATH else None)
         
         except (PermissionError, OSError):
-            STD_IN = [None, pathname]
+            STD_IN = (None, pathname)
         
     else:
-        STD_IN = [None, pathname]
+        STD_IN = (None, pathname)
 
     return STD_IN
 
@@ -2,8 +2,12 @@
 Necessary procedures to prepare the program to work
 as intended.
 """
+import functools
 import os
 import platform
+import re
+import sys
+from importlib.metadata import distributions
 from typing import List, Optional
 from src.settings.info import User, Info, SysPaths
 import subprocess
@@ -25,6 +29,8 @@ def setup() -> Info:
     """
     
     OS_NAME = platform.system().lower()
+
+    # NOTE: the requirement installers are currently disabled, nothing below runs them
     # if OS_NAME.startswith("win"):
     #     install_windows_requirements()
     
@@ -43,12 +49,20 @@ def setup() -> Info:
     return INFO
 
 
+@functools.cache
 def get_interpreter_command() -> Optional[str]:
     """
+    The result is cached as it can't change while Flux is running
+
     `:returns` : the command to use in order to interact with the python interpreter cli, None if not found
     `:dtype`   : str | None
     """
 
+    # The interpreter running Flux is the one we want to install packages for,
+    # probing the cli is only needed when python is embedded
+    if sys.executable:
+        return sys.executable
+
     commands = [
         ("python3", "--version"),
         ("python", "--version"),
@@ -68,18 +82,113 @@ def get_interpreter_command() -> Optional[str]:
     return None
 
 
+def is_in_venv() -> bool:
+    """
+    `:returns` : True if Flux is running inside a virtual environment
+    `:dtype`   : bool
+    """
+    return sys.prefix != sys.base_prefix
+
+
+def _normalize_name(name: str) -> str:
+    """
+    Normalizes a distribution name, so that `Python_Magic.bin` and `python-magic-bin`
+    are considered the same package
+    """
+    return re.sub(r"[-_.]+", "-", name).strip().lower()
+
+
+def get_missing_requirements(dep: List[str]) -> List[str]:
+    """
+    Filters out the requirements that are already installed with the
+    pinned version, the installed distributions are enumerated only once
+
+    `:returns` : the requirements that still need to be installed
+    `:dtype`   : list[str]
+    """
+
+    installed = {_normalize_name(d.metadata["Name"]): d.version for d in distributions() if d.metadata["Name"]}
+    missing = []
+
+    for req in dep:
+        name, _, version = req.partition("==")
+        if installed.get(_normalize_name(name)) != version.strip():
+            missing.append(req)
+
+    return missing
+
+
 def install_requirements(dep: List[str], verbose: Optional[bool] = None) -> Optional[subprocess.CompletedProcess]:
     try:
-        command = [get_interpreter_command(), "-m", "pip", "install"] + dep
+        interpreter = get_interpreter_command()
+        command = [interpreter, "-m", "pip", "install"] + dep
         if not verbose:
             dep_list = '\n  -  '.join(dep)
             print(f"installing: {dep_list}")
         
-        subprocess.run([get_interpreter_command(), "-m", "pip", "install", "--upgrade", "--user","pip"], capture_output=(not verbose), text=True, check=True)
-        return subprocess.run(command, capture_output=(not verbose), text=True, check=True)
+        # Upgrading pip costs a whole pip startup, only do it when asked to
+        if os.environ.get("FLUX_UPGRADE_PIP") == "1":
+            # pip refuses `--user` installs inside a virtual environment
+            user = [] if is_in_venv() else ["--user"]
+            subprocess.run([interpreter, "-m", "pip", "install", "--upgrade", *user, "pip"], capture_output=(not verbose), text=True, check=True)
     except subprocess.CalledProcessError:
         return None
 
+    try:
+        return subprocess.run(command, capture_output=(not verbose), text=True, check=True)
+    except subprocess.CalledProcessError:
+        if len(dep) < 2:
+            return None
+
+    # A single package may be stopping every other one from being installed
+    return _install_each(interpreter, dep, verbose)
+
+
+def _install_each(interpreter: str, dep: List[str], verbose: Optional[bool] = None) -> subprocess.CompletedProcess:
+    """
+    Installs every requirement with its own pip process, one after the other:
+    pip doesn't lock site-packages, so concurrent installs sharing a dependency
+    could overwrite each other's files
+
+    `:returns` : a single process reporting the highest return code and all the output
+    `:dtype`   : subprocess.CompletedProcess
+    """
+
+    processes = [
+        subprocess.run([interpreter, "-m", "pip", "install", req], capture_output=(not verbose), text=True)
+        for req in dep
+    ]
+
+    return subprocess.CompletedProcess(
+        args=[interpreter, "-m", "pip", "install"] + dep,
+        returncode=max(p.returncode for p in processes),
+        stdout="".join(p.stdout or "" for p in processes),
+        stderr="".join(p.stderr or "" for p in processes),
+    )
+
+
+def handle_requirements(dep: List[str]) -> None:
+    """
+    Installs the requirements that are not already found
+    """
+
+    # Order preserving, keeps pip's input stable
+    dep = list(dict.fromkeys(dep))
+    missing = get_missing_requirements(dep)
+
+    if missing:
+        p = install_requirements(missing, True)
+
+        if not p or p.returncode != 0:
+            if p:
+                print(p.stderr)
+            return
+
+        if p.stderr:
+            print(p.stderr)
+        else:
+            print("all requirements installed")
+
 
 def install_windows_requirements() -> None:
     """
@@ -93,13 +202,7 @@ def install_windows_requirements() -> None:
         "python-magic-bin==0.4.14",
     ]
 
-    p = install_requirements(dep, True)
-
-    if p and (p.returncode != 0 or p.stderr):
-        print(p.stderr)
-    else:
-        print("all requirements installed")
-        
+    handle_requirements(dep)
 
 
 def install_linux_requirements() -> None:
@@ -113,9 +216,4 @@ def install_linux_requirements() -> None:
         "PyPDF2==3.0.1",
     ]
 
-    p = install_requirements(dep, True)
-   
-    if p and (p.returncode != 0 or p.stderr):
-        print(p.stderr)
-    else:
-        print("all requirements installed")
\ No newline at end of file
+    handle_requirements(dep)
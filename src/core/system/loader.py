@@ -1,4 +1,5 @@
 import os
+import sys
 import importlib
 from src.settings.info import Info
 from pathlib import Path
@@ -6,7 +7,8 @@ from typing import Callable, Optional, TextIO
 
 # List of directories to search for custom scripts/extensions
 custom_script_dirs = ["fpm"]
-manager_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+loader_dir = os.path.dirname(os.path.realpath(__file__))
+manager_dir = os.path.dirname(loader_dir)
 
 def load_custom_script(script_name: str) -> Optional[Callable[[Info, str, bool, TextIO, TextIO, TextIO], None]]:
     """
@@ -28,14 +30,23 @@ def load_builtin_script(script_name: str) -> Optional[Callable[[Info, str, bool,
     """
     Load an internal command installed on the machine
     """
+    module_name = f"src.core.cmd.builtin.{script_name}"
     dir_name = os.path.join(manager_dir, "cmd", "builtin")
     script_path = os.path.join(dir_name, script_name + ".py")
-    if os.path.exists(script_path) and os.path.isfile(script_path):
+
+    # Commands that have already been used are found without touching the disk
+    module = sys.modules.get(module_name)
+
+    if module or os.path.isfile(script_path):
         try:
-            cwd = os.getcwd()
-            os.chdir(os.path.dirname(os.path.realpath(__file__)))
-            module = importlib.import_module(f"src.core.cmd.builtin.{script_name}", "src")
-            os.chdir(cwd)
+            if not module:
+                cwd = os.getcwd()
+                os.chdir(loader_dir)
+                try:
+                    module = importlib.import_module(module_name, "src")
+                finally:
+                    # The shell relies on the working directory being left as it was
+                    os.chdir(cwd)
             try:
                 # TODO: Allow to specify a different name than 'Command' as class name
                 if hasattr(module, "ENTRY_POINT"):
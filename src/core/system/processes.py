@@ -1,6 +1,7 @@
-from threading import Thread
+from threading import Thread, current_thread
+import itertools as _itertools
 import time as _time
-from typing import List, Callable, Union
+from typing import List, Callable, Optional, Union
 import os as _os
 
 # Process status codes
@@ -38,7 +39,8 @@ class ProcessInfo:
 
 
 class Process:
-    def __init__(self, id: int, owner: str, command_instance: Union[Callable, object], line_args: list[str], is_reserved_process: bool) -> None:
+    def __init__(self, id: int, owner: str, command_instance: Union[Callable, object], line_args: list[str], is_reserved_process: bool,
+                 on_exit: Optional[Callable[["Process"], None]] = None) -> None:
         self.id: int = id
         self.name: str = line_args[0]
         self.owner: str = owner
@@ -49,6 +51,7 @@ class Process:
         self.thread: Thread = None
         self.native_id: int | None = None
         self.is_reserved_process = is_reserved_process
+        self.on_exit = on_exit
 
     def get_info(self) -> ProcessInfo:
         return ProcessInfo(self.id,
@@ -65,23 +68,25 @@ class Process:
         return self.get_info().__str__()
 
     def _calculate_time(self, seconds: float) -> str:
-        hours, remainder = divmod(seconds, 3600)
+        hours, remainder = divmod(int(seconds), 3600)
         minutes, seconds = divmod(remainder, 60)
 
-        if hours > 0:
-            return f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
-        
-        if minutes > 0:
-            return f"{int(minutes)}m {int(seconds)}s"
+        if hours:
+            return f"{hours}h {minutes}m {seconds}s"
+
+        if minutes:
+            return f"{minutes}m {seconds}s"
 
-        return f"{int(seconds)}s"
+        return f"{seconds}s"
 
 
     def run(self, is_main_thread=False):
         if is_main_thread:
-            self.thread = Thread(target=self._run_main, name=self.name)
-            self.thread.start()
+            # The shell runs on the thread that started it, a new thread would only
+            # leave this one waiting for it to finish
+            self.thread = current_thread()
             self.native_id = self.thread.native_id
+            self._run_main()
             return
 
         self.thread = Thread(target=self._run, name=self.name, daemon=True)
@@ -108,48 +113,53 @@ class Process:
             self.command_instance.fail_safe(e)
             self.status = self.command_instance.status
 
+        finally:
+            # Lets the owner forget about the process as soon as it stops
+            if self.on_exit:
+                self.on_exit(self)
 
         print(f"[{self.id}] {self.name} stopped")
 
 
 class Processes:
     def __init__(self):
-        self.processes: list[Process] = []
-        self.process_counter: int = _os.getpid()
+        self.processes: dict[int, Process] = {}
+        self._next_id = _itertools.count(_os.getpid() + 1)
 
     def list(self) -> list[ProcessInfo]:
         # Avoid returning the system managed list of processes
         # Instead return a copy
-        return [p.get_info() for p in self.processes.copy()]
+        return [p.get_info() for p in list(self.processes.values())]
 
     def _generate_pid(self) -> int:
-        self.process_counter += 1
-        return self.process_counter
+        # next() on a count is atomic, unlike += 1 from several threads
+        return next(self._next_id)
 
     def _add_main_process(self, info: object, prog_name: str, callable: Callable):
-        self.processes.append(Process(id=self._generate_pid(), owner=info.user.username,
-                              command_instance=callable, line_args=prog_name, is_reserved_process=True))
-        self.processes[-1].run(is_main_thread=True)
+        process = Process(id=self._generate_pid(), owner=info.user.username,
+                          command_instance=callable, line_args=prog_name, is_reserved_process=True)
+        self.processes[process.id] = process
+        process.run(is_main_thread=True)
 
     def add(self, info: object, line_args: List[str], command_instance: object, is_reserved: bool):
-        self.processes.append(Process(id=self._generate_pid(), owner=info.user.username,
-                              command_instance=command_instance, line_args=line_args, is_reserved_process=is_reserved))
-        print(f"[{self.processes[-1].id}] {line_args[0]}")
-        self.processes[-1].run()
+        process = Process(id=self._generate_pid(), owner=info.user.username,
+                          command_instance=command_instance, line_args=line_args, is_reserved_process=is_reserved,
+                          on_exit=self._reap)
+        self.processes[process.id] = process
+        print(f"[{process.id}] {line_args[0]}")
+        process.run()
         _time.sleep(.1)
 
+    def _reap(self, process: Process) -> None:
+        # Only drop the entry if the id still belongs to this process
+        if self.processes.get(process.id) is process:
+            self.processes.pop(process.id, None)
+
     def find(self, id: int) -> Process | None:
-        for p in self.processes:
-            if p.id == id:
-                return p
-        return None
-
-    def remove(self, id: int) -> Process:
-        for p in self.processes:
-            if p.id == id:
-                self.processes.remove(p)
-                return p
-        return None
+        return self.processes.get(id)
+
+    def remove(self, id: int) -> Process | None:
+        return self.processes.pop(id, None)
 
     def clean(self) -> None:
         """
@@ -158,12 +168,12 @@ class Processes:
         This function is automaticaly called each time the manager handles a command
         """
 
-        for p in self.processes:
-            if not p.thread.is_alive():
-                self.processes.remove(p)
+        # Rebuilt from a snapshot, finished processes may remove themselves meanwhile
+        self.processes = {id: p for id, p in list(self.processes.items()) if p.thread.is_alive()}
 
     def copy(self):
         processes = Processes()
         processes.processes = self.processes.copy()
+        processes._next_id = self._next_id
         return processes
         
@@ -80,10 +80,7 @@ class Variables:
         """
         Checks if a variable exists
         """
-        for v in self._variables:
-            if v == name:
-                return True
-        return False
+        return name in self._variables
 
     def get(self, name: str, default: Any = None) -> Optional[Variable]:
         """
@@ -92,18 +89,16 @@ class Variables:
         Returns it's value if the variable has been remove found, otherwise returns default
         """
 
-        for var in self._variables:
-            if var == name:
-                return self._variables.get(var).copy()
-
-        return default
+        var = self._variables.get(name)
+        return var.copy() if var else default
 
     def set(self, name: str, value: str) -> None:
         """
         Update the value of a variable
         """
 
-        var = self.get(name)
+        # get() returns a copy, the stored variable is the one to update
+        var = self._variables.get(name)
 
         if not var:
             raise ValueError("invalid key %s" % name)
@@ -1,17 +1,31 @@
 # External Dependencies
+import functools
 import sys
 import os
 import signal
 from colorama import init, Fore
 
 sys.path.append("..")
-init(autoreset=True)
 
 # Flux modules
 from core import setup, manager
 from settings.info import Info
 import utils
 
+# Bound once, colorama's wrapped stdout still translates them on windows
+_GREEN, _CYAN, _YELLOW, _WHITE, _MAGENTA = Fore.GREEN, Fore.CYAN, Fore.YELLOW, Fore.WHITE, Fore.MAGENTA
+_CTRL_C = f"{Fore.RED}^C{Fore.RESET}\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _build_prompt(username: str, version: str, terminal: str | os.PathLike) -> str:
+    """
+    Builds the prompt shown before each command, cached as it only changes
+    when the user moves to another directory
+    """
+    return f"{_GREEN}{username}{_CYAN} Flux [{version}] {_YELLOW}{str(terminal).lower()}{_WHITE}{_MAGENTA} $ "
+
+
 def listen() -> list[str]:
     """
     This function is used to get the command typed by the user preceded by
@@ -19,32 +33,67 @@ def listen() -> list[str]:
     the version and the location where Flux is oparating on the disk.
     """
     try:
-        print(
-            f"{Fore.GREEN}{INFO.user.username}{Fore.CYAN} Flux [{INFO.version}] {Fore.YELLOW}" + str(INFO.user.paths.terminal).lower() + f"{Fore.WHITE}{Fore.MAGENTA} $ ", end="")
+        user = INFO.user
+        sys.stdout.write(_build_prompt(user.username, INFO.version, user.paths.terminal))
+        sys.stdout.flush()
         command = input()
-        print(f"{Fore.WHITE}", end="")
+        print(_WHITE, end="")
 
         return utils.transform.string_to_list(command)
 
     except (KeyboardInterrupt, EOFError):
-        print(f"{Fore.RED}^C{Fore.RESET}")
+        sys.stdout.write(_CTRL_C)
         return []
 
 
+def _bootstrap() -> Info:
+    """
+    Prepares the terminal and runs the setup, only when Flux is started
+    and not when this module gets imported
+    """
+    init(autoreset=True)
+    return setup.setup()
+
+
+def _exit(cmd: list[str], info: Info) -> None:
+    info.exit = True
+
+
+# Commands handled by the shell itself instead of the manager
+_BUILTINS = {
+    "exit": _exit,
+}
+
+
 def run():
+    # Commands keep the working directory in sync with the terminal path,
+    # so it only needs to be applied when the terminal path changes
+    current_dir = None
+
+    # Bound once for the whole session instead of looked up on every command
+    chdir = os.chdir
+    get_builtin = _BUILTINS.get
+    manage = manager.manage
+
+    # The user's paths object stays the same for the whole session, only its fields change
+    paths = INFO.user.paths
+
     while not INFO.exit:
-        os.chdir(INFO.user.paths.terminal)
+        if paths.terminal != current_dir:
+            current_dir = paths.terminal
+            chdir(current_dir)
         try:
             cmd = listen()
 
             if cmd:
-                if cmd[0] == "exit":
-                    INFO.exit = True
+                builtin = get_builtin(cmd[0])
+
+                if builtin:
+                    builtin(cmd, INFO)
 
                 # Pass the command to the manager
-                else:
-                    if cmd[0] != "":
-                        manager.manage(cmd, INFO)
+                elif cmd[0] != "":
+                    manage(cmd, INFO)
         except KeyboardInterrupt:
             pass
 
@@ -64,7 +113,7 @@ if __name__ == "__main__":
                     case _: sys.exit(1)
 
         # Setup process
-        INFO: Info = setup.setup()
+        INFO: Info = _bootstrap()
 
         del setup
         del Info
@@ -87,12 +136,17 @@ if __name__ == "__main__":
 
         # Something REALLY weird is going on if execution reaches here
 
-        sys.stderr.write("Failed do start\n")
-        sys.stderr.write("We belive the problem might be on your system\n")
-        sys.stderr.write(f"\nError message \n{'-' * 13}\n{type(e).__name__}: {e.__str__()}\n\n")
-
         log_path = utils.crash_handler.write_error_log()[1]
-        sys.stderr.write("The full traceback of this error can be found here: \n" + log_path + "\n")
+
+        # Written at once so nothing else ends up in the middle of the report
+        sys.stderr.write("".join((
+            "Failed do start\n",
+            "We belive the problem might be on your system\n",
+            f"\nError message \n{'-' * 13}\n{type(e).__name__}: {e}\n\n",
+            "The full traceback of this error can be found here: \n",
+            log_path,
+            "\n",
+        )))
 
         sys.exit(1)
 
@@ -1,12 +1,15 @@
+import functools
 import json
 import os
 import pathlib
+from contextlib import contextmanager
+from typing import Iterator
 
 from src.core.system.variables import Variables
 from src.core.system.processes import Processes
 
-with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'version'), mode='r', encoding='utf-8') as version:
-    VERSION = version.read()
+# Stripped, so that a trailing newline added by an editor doesn't end up in the prompt
+VERSION = pathlib.Path(os.path.dirname(os.path.realpath(__file__)), 'version').read_bytes().decode('utf-8').strip()
 
 
 class SysPaths:
@@ -32,7 +35,51 @@ class SysPaths:
 
     def copy(self):
         return SysPaths()
-            
+
+
+@contextmanager
+def _edit_settings() -> Iterator[dict]:
+    """
+    Reads the settings file and writes it back once the `with` block exits
+    ```
+    with _edit_settings() as settings:
+        settings["username"] = new_username
+    ```
+    """
+    settings = json.loads(SysPaths.SETTINGS_FILE.read_bytes())
+    yield settings
+
+    _write_settings(settings)
+
+
+def _write_settings(settings: dict) -> None:
+    """
+    Writes the settings to a temporary file that then replaces the settings file,
+    this way a crash can't leave the settings file half written
+    """
+    tmp = SysPaths.SETTINGS_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(settings, indent=4, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, SysPaths.SETTINGS_FILE)
+
+    _parse_settings.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_settings(path: pathlib.Path, mtime_ns: int, size: int) -> dict:
+    return json.loads(path.read_bytes())
+
+
+def _load_settings() -> dict:
+    """
+    Returns the parsed settings file, the file is parsed again only if it
+    changed since the last call
+
+    The returned dict is shared between callers and must not be modified,
+    use `_edit_settings()` to change the settings
+    """
+    stat = os.stat(SysPaths.SETTINGS_FILE)
+    return _parse_settings(SysPaths.SETTINGS_FILE, stat.st_mtime_ns, stat.st_size)
+
 
 class Info:
     ...
@@ -60,8 +107,7 @@ class User():
 
     def __init__(self):
         try:
-            with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-                sett = json.load(f)
+            sett = _load_settings()
 
             self.email: str = sett["email"]
             self.username: str = sett["username"]
@@ -91,8 +137,7 @@ class User():
         """
 
         # Create the settings file
-        with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as file:
-            file.write("{}")
+        _write_settings({})
 
         path = Path(False)
         bg_tasks = BgTasks()
@@ -108,9 +153,7 @@ class User():
         # Check if there already is a settings file, if there is, overwrite it, otherwise
         # create a new one
 
-        with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-            l.write("")
-            json.dump(settings, l, indent=4, sort_keys=True)
+        _write_settings(settings)
 
     def set_username(self, new_username: str, info: Info, reset: bool = False) -> None:
         """
@@ -120,12 +163,8 @@ class User():
             new_username = os.path.basename(os.path.expanduser('~'))
 
         info.user.username = new_username
-        with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-            settings = json.load(f)
+        with _edit_settings() as settings:
             settings['username'] = new_username
-            with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                l.write("")
-                json.dump(settings, l, indent=4, sort_keys=True)
 
     def set_bg_task(self, info: Info, tasks: list, reset: bool):
 
@@ -166,11 +205,8 @@ class User():
         """
         if reset:
             info.user.email = ""
-            with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-                sett: list = json.load(f)
+            with _edit_settings() as sett:
                 sett["email"] = info.user.email
-                with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                    json.dump(sett, l, indent=4, sort_keys=True)
 
             print("Email changed to: ''")
             return
@@ -202,11 +238,8 @@ class User():
 
                 # Update the email
                 info.user.email = email
-                with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-                    sett: list = json.load(f)
+                with _edit_settings() as sett:
                     sett["email"] = email
-                    with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                        json.dump(sett, l, indent=4, sort_keys=True)
 
                 print("Email changed to: ", email)
                 return
@@ -229,20 +262,19 @@ class Path:
             return
 
         try:
-            with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-                path: dict = json.load(f)["paths"]
-                self.all_paths = path.copy()
-
-                self.terminal: pathlib.Path = pathlib.Path(
-                    path["terminal"]).resolve()
-                self.documents: pathlib.Path = pathlib.Path(
-                    path["documents"]).resolve()
-                self.images: pathlib.Path = pathlib.Path(
-                    path["images"]).resolve()
-                self.bucket: pathlib.Path = pathlib.Path(
-                    path["bucket"]).resolve()
-                self.bucket_destination: pathlib.Path = pathlib.Path(
-                    path["bucket-destination"]).resolve()
+            path: dict = _load_settings()["paths"]
+            self.all_paths = path.copy()
+
+            self.terminal: pathlib.Path = pathlib.Path(
+                path["terminal"]).resolve()
+            self.documents: pathlib.Path = pathlib.Path(
+                path["documents"]).resolve()
+            self.images: pathlib.Path = pathlib.Path(
+                path["images"]).resolve()
+            self.bucket: pathlib.Path = pathlib.Path(
+                path["bucket"]).resolve()
+            self.bucket_destination: pathlib.Path = pathlib.Path(
+                path["bucket-destination"]).resolve()
 
         except KeyError:
             self.reset()
@@ -362,11 +394,8 @@ class Path:
                 print(f"Permission denied to create {new_path}")
                 return
 
-        with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-            tasks: dict = json.load(f)
+        with _edit_settings() as tasks:
             tasks["paths"][target] = str(new_path)
-            with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                json.dump(tasks, l, indent=4, sort_keys=True)
         print(f"Successfully changed path.{target} to {new_path}\n")
 
 
@@ -377,9 +406,8 @@ class BgTasks():
 
     def __init__(self):
         try:
-            with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-                tasks = json.load(f)["background-tasks"]
-                self.tasks: list = tasks if tasks else []
+            tasks = _load_settings()["background-tasks"]
+            self.tasks: list = list(tasks) if tasks else []
 
         except KeyError:
             self.reset()
@@ -388,20 +416,12 @@ class BgTasks():
         self.tasks = []
 
     def add_task(self, task: str):
-        with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-            tasks: list = json.load(f)
+        with _edit_settings() as tasks:
             tasks["background-tasks"].append(task)
-            with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                # print(tasks)
-                json.dump(tasks, l, indent=4, sort_keys=True)
 
     def remove_task(self, task: str):
-        with open(SysPaths.SETTINGS_FILE, "r", encoding='utf-8') as f:
-            tasks: list = json.load(f)
+        with _edit_settings() as tasks:
             tasks["background-tasks"].remove(task)
-            with open(SysPaths.SETTINGS_FILE, "w", encoding='utf-8') as l:
-                # print(tasks)
-                json.dump(tasks, l, indent=4, sort_keys=True)
 
 class Info:
     """
@@ -1,6 +1,3 @@
-import shlex
-
-
 def string_to_list(string: str) -> list[str]:
     """
     Adapts the list to be used in a shell environment by
@@ -13,19 +10,117 @@ def string_to_list(string: str) -> list[str]:
     ```
     """
 
-    words = shlex.split(string)
+    words = _split(string)
     if len(words) > 0:
-        words[0] = words[0].lower() if not words[0].startswith("$") else words[0]
+        first = words[0]
+
+        # Commands are usually typed lowercase already, no need for a new string then
+        if not (first.islower() or first.startswith("$")):
+            words[0] = first.lower()
 
         command = []
         for arg in words:
-            command += _separate_redirect_parts(arg)
+            command.extend(_separate_redirect_parts(arg))
 
         return command
 
     return []
 
 
+# Same whitespace as shlex, which only splits on these
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+def _split(string: str) -> list[str]:
+    """
+    Splits a command line in a single pass, with the same rules as `shlex.split`
+
+    - single quotes keep everything literally
+    - double quotes only let a backslash escape another backslash or a double quote
+    - outside of quotes a backslash escapes any character
+
+    `:returns` the words in the line
+    `:rtype` list[str]
+    `:raises` ValueError on unclosed quotes or a trailing backslash, like shlex
+    """
+
+    # Nothing to resolve, only spaces can separate words here
+    if string.isprintable() and not ("'" in string or '"' in string or "\\" in string):
+        return string.split()
+
+    words: list[str] = []
+    word: list[str] = []
+    in_word = False  # An empty pair of quotes still makes an (empty) word
+    quote = None
+    i = 0
+    n = len(string)
+
+    while i < n:
+        char = string[i]
+
+        if quote == "'":
+            end = string.find("'", i)
+            if end == -1:
+                raise ValueError("No closing quotation")
+            word.append(string[i:end])
+            quote = None
+            i = end + 1
+            continue
+
+        if quote == '"':
+            if char == '"':
+                quote = None
+            elif char == "\\":
+                i += 1
+                if i == n:
+                    raise ValueError("No escaped character")
+                if string[i] not in '\\"':
+                    word.append(char)
+                word.append(string[i])
+            else:
+                word.append(char)
+
+        elif char in _WHITESPACE:
+            if in_word:
+                words.append("".join(word))
+                word.clear()
+                in_word = False
+
+        elif char == "'" or char == '"':
+            quote = char
+            in_word = True
+
+        elif char == "\\":
+            i += 1
+            if i == n:
+                raise ValueError("No escaped character")
+            word.append(string[i])
+            in_word = True
+
+        else:
+            word.append(char)
+            in_word = True
+
+        i += 1
+
+    if quote:
+        raise ValueError("No closing quotation")
+
+    if in_word:
+        words.append("".join(word))
+
+    return words
+
+
+# This order is NOT random, longer symbols must be matched first
+_LONG_REDIRECT = ("1>>", "2>>", "&>>", "<<<")
+_MEDIUM_REDIRECT = (">>", "<<", "1>", "2>", "&>", "|&")
+_SHORT_REDIRECT = (">", "<", "|")
+
+_REDIRECTS = _LONG_REDIRECT + _MEDIUM_REDIRECT + _SHORT_REDIRECT
+_REDIRECT_START = frozenset(i[0] for i in _REDIRECTS)
+
+
 def _separate_redirect_parts(arg: str) -> list[str]:
     """
     This takes as input a string and separates the
@@ -36,15 +131,11 @@ def _separate_redirect_parts(arg: str) -> list[str]:
     separate_redirect_parts("/dev/null") -> ["/dev/null"]
     """
 
-    # This order is NOT random
-    
-    LONG_REDIRECT = ["1>>", "2>>", "&>>", "<<<"]
-    MEDIUM_REDIRECT = [">>", "<<", "1>", "2>", "&>", "|&"]
-    SHORT_REDIRECT = [">", "<", "|"]
-
-    LOOK_FOR = LONG_REDIRECT + MEDIUM_REDIRECT + SHORT_REDIRECT
+    # Most words can't be a redirect at all
+    if not arg or arg[0] not in _REDIRECT_START:
+        return [arg]
 
-    for i in LOOK_FOR:
+    for i in _REDIRECTS:
         if arg.startswith(i):
             if arg == i:
                 return [i]
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from watchdog.events import DirCreatedEvent, FileCreatedEvent, FileMovedEvent
+from src.core.cmd.builtin import observer
+
+
+class Test_TestObserver(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+
+        # Sort with the default extensions, whatever the user's settings are
+        self.addCleanup(self.restore_extensions, observer.extension_paths)
+        observer.extension_paths = dict(observer.EXTENSIONS)
+        observer._index_extensions()
+
+        self.bucket = os.path.join(self.tmp, "bucket")
+        self.dest = os.path.join(self.bucket, "Files")
+        self.handler = observer.Command.EventHandler(Path(self.bucket), Path(self.dest))
+
+        # Compare against the resolved paths used by the handler
+        self.bucket = self.handler.watch_path
+        self.dest = self.handler.destination_root
+
+    def restore_extensions(self, extensions: dict) -> None:
+        observer.extension_paths = extensions
+        observer._index_extensions()
+
+    def touch(self, *parts: str) -> str:
+        path = os.path.join(*parts)
+        with open(path, "w") as f:
+            f.write(os.path.basename(path))
+        return path
+
+    def create(self, name: str) -> str:
+        """
+        Creates a file in the bucket and passes its event to the handler
+        """
+        path = self.touch(self.bucket, name)
+        self.handler.on_created(FileCreatedEvent(path))
+        return path
+
+    def listdir(self, subdir: str) -> list[str]:
+        return sorted(os.listdir(os.path.join(self.dest, subdir)))
+
+    def test_created_file_is_sorted(self):
+        """
+        Check if a new file is moved to the folder of its extension
+        """
+        path = self.create("a.jpg")
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.listdir("media/images"), ["a.jpg"])
+
+    def test_moved_file_is_sorted(self):
+        """
+        Check if a file renamed or moved into the bucket is sorted by its new name
+        """
+        source = self.touch(self.tmp, "a.part")
+        path = os.path.join(self.bucket, "a.pdf")
+        os.replace(source, path)
+        self.handler.on_moved(FileMovedEvent(source, path))
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.listdir("text/pdf"), ["a.pdf"])
+
+    def test_collisions_are_numbered(self):
+        """
+        Check if files with the same name get numbered instead of overwritten
+        """
+        for _ in range(3):
+            self.create("a.jpg")
+
+        self.assertEqual(self.listdir("media/images"), ["a.jpg", "a_1.jpg", "a_2.jpg"])
+
+        # Numbering continues after the last number used
+        os.remove(os.path.join(self.dest, "media/images", "a_1.jpg"))
+        self.create("a.jpg")
+        self.assertEqual(self.listdir("media/images"), ["a.jpg", "a_2.jpg", "a_3.jpg"])
+
+    def test_case_only_clashes_the_filesystem(self):
+        """
+        Check if names differing only by case are numbered only where the filesystem ignores case
+        """
+        self.create("a.jpg")
+        self.create("A.JPG")
+
+        if self.handler._case_insensitive:
+            expected = ["A_1.JPG", "a.jpg"]
+        else:
+            expected = ["A.JPG", "a.jpg"]
+        self.assertEqual(self.listdir("media/images"), expected)
+
+    def test_subfolders_are_ignored(self):
+        """
+        Check if files in subfolders of the bucket and directory events are left alone
+        """
+        os.makedirs(os.path.join(self.bucket, "sub"))
+        path = self.touch(self.bucket, "sub", "a.jpg")
+        self.handler.on_created(FileCreatedEvent(path))
+        self.handler.on_created(DirCreatedEvent(os.path.join(self.bucket, "sub")))
+
+        self.assertTrue(os.path.isfile(path))
+        self.assertEqual(os.listdir(self.dest), [])
+
+    def test_extension_matching(self):
+        """
+        Check if the longest extension wins, matching ignores case and dotfiles have no extension
+        """
+        self.create("x.tar.gz")
+        self.create("B.JPG")
+        self.create(".jpg")
+        self.create("noextension")
+
+        self.assertEqual(self.listdir("other/compressed"), ["x.tar.gz"])
+        self.assertEqual(self.listdir("media/images"), ["B.JPG"])
+        self.assertEqual(self.listdir("other/uncategorized"), [".jpg", "noextension"])
+
+    def test_scan_sorts_existing_files(self):
+        """
+        Check if a scan sorts the files already in the bucket, numbering clashes among them
+        """
+        os.makedirs(os.path.join(self.dest, "media/images"))
+        self.touch(self.dest, "media/images", "a.jpg")
+        self.touch(self.bucket, "a.jpg")
+        self.touch(self.bucket, "b.odt")
+        os.makedirs(os.path.join(self.bucket, "sub"))
+
+        self.handler.scan()
+
+        self.assertEqual(self.listdir("media/images"), ["a.jpg", "a_1.jpg"])
+        self.assertEqual(self.listdir("text/text_files"), ["b.odt"])
+        self.assertEqual(sorted(os.listdir(self.bucket)), ["Files", "sub"])
+
+    def test_deleted_destination_is_restored(self):
+        """
+        Check if the destination folders are created again after being deleted
+        """
+        self.create("a.jpg")
+        shutil.rmtree(self.dest)
+        self.create("b.jpg")
+
+        self.assertEqual(self.listdir("media/images"), ["b.jpg"])
+
+
+if __name__ == '__main__':
+    unittest.main()
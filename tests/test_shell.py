@@ -1,3 +1,4 @@
+import importlib
 import os
 import sys
 import unittest
@@ -40,6 +41,12 @@ class Test_TestShell(unittest.TestCase):
             
             self.instance = None
 
+    @staticmethod
+    def unload_core_package(loaded: set) -> None:
+        for name in set(sys.modules) - loaded:
+            if name == "core" or name.startswith("core."):
+                del sys.modules[name]
+
     def test_build_01(self):
         command = utils.transform.string_to_list("not existent command")
         self.instance = manager.build(command, info)
@@ -85,5 +92,37 @@ class Test_TestShell(unittest.TestCase):
         self.instance = manager.build(command, info)
         self.assertTrue(self.instance is None)
 
+    def test_redirects_return_tuples(self):
+        command = utils.transform.string_to_list("ls")
+        for redirect in (manager.get_stdout, manager.get_stderr, manager.get_stdin):
+            result = redirect(command)
+            self.assertTrue(isinstance(result, tuple) and len(result) == 2, result)
+
+        stream, path = manager.get_stdout(utils.transform.string_to_list(f"ls > {FILE}"))
+        stream.close()
+        self.assertTrue(path == FILE, path)
+
+    def test_build_through_core_package(self):
+        """
+        main.py imports the manager as `core.manager`, while builtins are loaded as
+        `src.core.cmd.builtin.*`, so commands must be recognised across both imports
+        """
+        src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+        # Drop the second `core` package afterwards, so the other tests keep a single import
+        loaded = set(sys.modules)
+        self.addCleanup(self.unload_core_package, loaded)
+
+        sys.path.insert(0, src_dir)
+        try:
+            core_manager = importlib.import_module("core.manager")
+        finally:
+            sys.path.remove(src_dir)
+
+        self.instance = core_manager.build(["touch", FILE], info)
+        self.assertFalse(self.instance is None)
+        self.assertTrue(core_manager.call(self.instance) == 0)
+
+
 if __name__ == '__main__':
     unittest.main()
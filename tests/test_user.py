@@ -16,12 +16,12 @@ class Test_TestUser(unittest.TestCase):
 
         info = setup.setup()
         USER = info.user
-        types = [
-            type(USER.email) == str,
-            type(USER.paths) == Path,
-            type(USER.background_tasks) == list,
-        ]
-        result = all(types)
+        expected = (
+            ("email", str),
+            ("paths", Path),
+            ("background_tasks", list),
+        )
+        result = all(isinstance(getattr(USER, name), cls) for name, cls in expected)
 
         if not s_file_exists:
             # check if it has been created before deleting
@@ -1,3 +1,5 @@
+import random
+import shlex
 import unittest
 from src.utils import transform
 
@@ -22,39 +24,52 @@ class Test_TestUtils(unittest.TestCase):
         formatted = transform.string_to_list(test)
         self.assertTrue(formatted == ["hello", "World!"])
 
+
+# (input, expected output) of string_to_list
+_CASES = (
+    ("ls", ["ls"]),
+    ("   ls   ", ["ls"]),
+    ("LS -h", ["ls", "-h"]),
+    ("LS -R", ["ls", "-R"]),
+    ("ls >> file", ["ls", ">>", "file"]),
+    ("ls 2>/dev/null", ["ls", "2>", "/dev/null"]),
+    ("LS << Input.txt", ["ls", "<<", "Input.txt"]),
+    ("echo test | ls", ["echo", "test", "|", "ls"]),
+    ("cat 'some file' \"other \\\"file\\\"\"", ["cat", "some file", 'other "file"']),
+)
+
+
 class Test_TestStringToList(unittest.TestCase):
 
-    def test_01(self):
-        cmd = transform.string_to_list("ls")
-        self.assertTrue(cmd == ["ls"], cmd)
+    def test_cases(self):
+        for line, expected in _CASES:
+            with self.subTest(line=line):
+                self.assertEqual(transform.string_to_list(line), expected)
 
-    def test_02(self):
-        cmd = transform.string_to_list("   ls   ")
-        self.assertTrue(cmd == ["ls"], cmd)
+    def test_unbalanced_quoting(self):
+        self.assertRaises(ValueError, transform.string_to_list, "echo 'unclosed")
+        self.assertRaises(ValueError, transform.string_to_list, "echo trailing\\")
 
-    def test_03(self):
-        cmd = transform.string_to_list("LS -h")
-        self.assertTrue(cmd == ["ls", "-h"], cmd)
 
-    def test_04(self):
-        cmd = transform.string_to_list("LS -R")
-        self.assertTrue(cmd == ["ls", "-R"], cmd)
+class Test_TestSplit(unittest.TestCase):
 
-    def test_05(self):
-        cmd = transform.string_to_list("ls >> file")
-        self.assertTrue(cmd == ["ls", ">>", "file"], cmd)
+    def test_matches_shlex(self):
+        """
+        The tokenizer must split lines exactly like shlex.split
+        """
+        rnd = random.Random(0)
+        alphabet = "ab \t\n'\"\\>|$\u00a0"
 
-    def test_06(self):
-        cmd = transform.string_to_list("ls 2>/dev/null")
-        self.assertTrue(cmd == ["ls", "2>", "/dev/null"], cmd)
+        for _ in range(5000):
+            line = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
 
-    def test_07(self):
-        cmd = transform.string_to_list("LS << Input.txt")
-        self.assertTrue(cmd == ["ls", "<<", "Input.txt"], cmd)
+            try:
+                expected = shlex.split(line)
+            except ValueError:
+                self.assertRaises(ValueError, transform._split, line)
+                continue
 
-    def test_08(self):
-        cmd = transform.string_to_list("echo test | ls")
-        self.assertTrue(cmd == ["echo", "test", "|", "ls"], cmd)
+            self.assertEqual(transform._split(line), expected, repr(line))
 
 
 if __name__ == '__main__':
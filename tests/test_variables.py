@@ -48,6 +48,36 @@ class Test_Variables(unittest.TestCase):
         result = INFO.variables.get("$")
         self.assertTrue(result is None, "The variable has been created, but it wasn't supposed to")
 
+    def test_variables_04(self):
+        """
+        $PWD holds the absolute path after a relative cd
+        """
+
+        import os
+        import tempfile
+        from src.core import setup
+        from src.settings.info import Info
+        from src.core.cmd.builtin import cd
+
+        # setup() moves to the saved terminal path, so it runs before moving to the test folder
+        self.addCleanup(os.chdir, os.getcwd())
+        INFO: Info = setup.setup()
+
+        parent = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(os.rmdir, parent)
+        child = os.path.join(parent, "child")
+        os.mkdir(child)
+        self.addCleanup(os.rmdir, child)
+        os.chdir(child)
+
+        cmnd = cd.Command(INFO, ['cd', '..'], False)
+        cmnd.init()
+        cmnd.setup()
+        cmnd.run()
+        result = INFO.variables.get("$PWD").value
+        self.assertTrue(os.path.isabs(result), result)
+        self.assertTrue(os.path.samefile(result, parent), result)
+
 
 if __name__ == '__main__':
     unittest.main()